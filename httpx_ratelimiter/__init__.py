@@ -10,6 +10,8 @@ __all__ = [
     # httpx-ratelimiter main classes
     "LimiterTransport",
     "LimiterMixin",
+    "AsyncLimiterTransport",
+    "AsyncLimiterMixin",
     # pyrate-limiter main classes
     "Limiter",
     "BucketFullException",
@@ -18,6 +20,7 @@ __all__ = [
     "BucketFactory",
     # pyrate-limiter bucket backends
     "AbstractBucket",
+    "ArrayBucket",
     "InMemoryBucket",
     "RedisBucket",
     "SQLiteBucket",
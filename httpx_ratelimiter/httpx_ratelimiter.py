@@ -1,13 +1,30 @@
+import asyncio
+from array import array
+from bisect import bisect_left
+from contextlib import suppress
+from functools import cache
 from inspect import signature
 from logging import getLogger
+from operator import attrgetter
+from os import cpu_count
+from sys import intern
+from threading import Lock
+from time import monotonic, monotonic_ns
 from typing import TYPE_CHECKING, Union
 from collections.abc import Awaitable
 from collections.abc import Callable, Iterable
 from uuid import uuid4
 
-from httpx import BaseTransport, Response, Request, HTTPTransport
+from httpx import (
+    AsyncHTTPTransport,
+    BaseTransport,
+    HTTPTransport,
+    Request,
+    Response,
+)
 from pyrate_limiter import (
     AbstractBucket,
+    BucketFullException,
     InMemoryBucket,
     Limiter,
     Rate,
@@ -21,6 +38,202 @@ from pyrate_limiter import (
 MIXIN_BASE = BaseTransport if TYPE_CHECKING else object
 logger = getLogger(__name__)
 
+# Template for the specialized handle_request compiled in
+# LimiterMixin._specialize_handle_request; all dependencies are bound as
+# globals of the generated function, so the hot path carries no attribute
+# lookups on self
+_FAST_HANDLE_TEMPLATE = """
+def _fast_handle(self, request, **kwargs):
+    name = request.url.netloc
+    if not try_consume_local(name):
+        try_acquire(name)
+    response = super_handle(request, **kwargs)
+    if response.status_code == 429:
+        drain_local(name)
+        fill_bucket(name)
+    return response
+"""
+
+
+class MonotonicNSClock(AbstractClock):
+    """Integer clock sourced from :py:func:`time.monotonic_ns`.
+
+    Monotonic time can't be stepped backwards by NTP adjustments the way
+    wall-clock time can, and integer timestamps compare faster than floats.
+    pyrate-limiter rates and delays are denominated in milliseconds, so the
+    nanosecond reading is scaled down to integer milliseconds.
+
+    .. warning::
+        The monotonic epoch restarts with every process, so this clock is
+        only valid for buckets whose contents live and die with the
+        process. Persistent or shared backends (SQLite, Redis) must use a
+        wall-clock such as :py:class:`~pyrate_limiter.clocks.TimeClock`.
+    """
+
+    def now(self) -> int:  # noqa: PLR6301
+        return monotonic_ns() // 1_000_000
+
+
+class ArrayBucket(AbstractBucket):
+    """In-memory bucket storing bare timestamps in a compact ``array.array``.
+
+    Unlike :py:class:`~pyrate_limiter.buckets.InMemoryBucket`, which keeps a
+    Python list of ``RateItem`` objects, this bucket only stores the 64-bit
+    integer timestamps, with a moving head index marking the live region.
+    ``count()`` is O(1), leaking is a single binary search instead of a
+    Python-level item walk, and per-item memory drops from a full Python
+    object to 8 bytes.
+    """
+
+    def __init__(self, rates: list[Rate]):
+        self.rates = sorted(rates, key=lambda r: r.interval)
+        self.failing_rate = None
+        self._timestamps = array("q")
+        self._head = 0
+
+    def put(self, item: RateItem) -> bool:
+        timestamps = self._timestamps
+        for rate in self.rates:
+            lower_bound = item.timestamp - rate.interval
+            lower_bound_idx = bisect_left(timestamps, lower_bound, lo=self._head)
+            space_available = rate.limit - (len(timestamps) - lower_bound_idx)
+
+            if space_available < item.weight:
+                self.failing_rate = rate
+                return False
+
+        self.failing_rate = None
+        if item.weight == 1:
+            timestamps.append(item.timestamp)
+        else:
+            timestamps.extend(item.weight * [item.timestamp])
+        return True
+
+    def leak(self, current_timestamp: int | None = None) -> int:
+        assert current_timestamp is not None  # noqa: S101
+        timestamps = self._timestamps
+        head = self._head
+        if len(timestamps) == head:
+            return 0
+
+        lower_bound = current_timestamp - self.rates[-1].interval
+        idx = bisect_left(timestamps, lower_bound, lo=head)
+        removed = idx - head
+        if removed:
+            # Advance the head; only reclaim memory once the dead prefix
+            # dominates the array, so leaks stay O(log n) amortized
+            if idx * 2 >= len(timestamps):
+                del timestamps[:idx]
+                self._head = 0
+            else:
+                self._head = idx
+        return removed
+
+    def flush(self) -> None:
+        self.failing_rate = None
+        self._timestamps = array("q")
+        self._head = 0
+
+    def count(self) -> int:
+        return len(self._timestamps) - self._head
+
+    def peek(self, index: int) -> RateItem | None:
+        if abs(index) < self.count():
+            return RateItem("", self._timestamps[-1 - index])
+        return None
+
+
+class _LocalBucket:
+    """Per-name cache of tokens pre-borrowed from the real limiter, backing
+    the fast path in :py:meth:`LimiterMixin.handle_request`.
+
+    Tokens are only ever credited from weighted ``try_acquire`` batches, so
+    every request served from here has already been accounted for in the
+    real bucket and the configured rate cannot be exceeded. Banked tokens
+    expire after one rate interval, since by then the borrow that paid for
+    them has left the window.
+    """
+
+    __slots__ = (
+        "tokens",
+        "credited_at",
+        "limit",
+        "interval",
+        "window_start",
+        "window_count",
+        "ring",
+        "ring_sec",
+    )
+
+    def __init__(self, limit: float, interval: float):
+        self.tokens = 0.0
+        self.credited_at = monotonic()
+        self.limit = limit
+        self.interval = interval
+        self.window_start = self.credited_at
+        self.window_count = 0
+        # Rolling per-second request counts over the last minute, used to
+        # size batch borrows from the real limiter
+        self.ring = array("I", [0] * 60)
+        self.ring_sec = int(self.credited_at)
+
+    def try_consume(self, now: float) -> bool:
+        """Consume one pre-borrowed token, if one is banked and still fresh"""
+        if now - self.credited_at > self.interval:
+            # The borrow backing these tokens has left the rate window
+            self.tokens = 0.0
+        if self.tokens >= 1.0:  # noqa: PLR2004
+            self.tokens -= 1.0
+            self.record_admit(now)
+            return True
+        return False
+
+    def record_admit(self, now: float) -> None:
+        """Record a request that is actually being sent.
+
+        Only admitted requests count here: the window counter feeds the 429
+        catch-up math and the ring feeds borrow sizing, and both would be
+        inflated into uselessness by client-side rejections that never
+        reached the server.
+        """
+        if now - self.window_start >= self.interval:
+            self.window_start = now
+            self.window_count = 1
+        else:
+            self.window_count += 1
+        sec = int(now)
+        if sec != self.ring_sec:
+            # Zero the slots for any seconds that passed with no requests
+            if sec - self.ring_sec >= 60:  # noqa: PLR2004
+                for i in range(60):
+                    self.ring[i] = 0
+            else:
+                for stale in range(self.ring_sec + 1, sec + 1):
+                    self.ring[stale % 60] = 0
+            self.ring_sec = sec
+        self.ring[sec % 60] += 1
+
+    def suggest_borrow(self) -> int:
+        """Batch size for the next real-limiter acquisition: the p99 of the
+        observed per-second request counts, clamped to the estimated
+        remaining capacity of the current window so an oversized batch
+        doesn't trip the limiter's delay/raise handling.
+        """
+        p99 = sorted(self.ring)[58]
+        headroom = int(self.limit - self.window_count)
+        borrow = p99 if p99 < headroom else headroom
+        return borrow if borrow > 1 else 1
+
+    def credit(self, tokens: float, now: float) -> None:
+        """Bank tokens pre-borrowed from the real limiter in a batch"""
+        total = self.tokens + tokens
+        self.tokens = total if total < self.limit else self.limit
+        self.credited_at = now
+
+    def drain(self) -> None:
+        """Drop all banked tokens, e.g. after a server-side 429"""
+        self.tokens = 0.0
+
 
 class NameBucketFactory(BucketFactory):
     """Bucket factory, that will move items based on their name"""
@@ -31,39 +244,88 @@ class NameBucketFactory(BucketFactory):
         self,
         rates: list[Rate],
         default_name: str,
-        clock: type[AbstractClock] = TimeClock,
-        bucket_class: type[AbstractBucket] = InMemoryBucket,
+        clock: type[AbstractClock] | None = None,
+        bucket_class: type[AbstractBucket] = ArrayBucket,
         bucket_kwargs: dict | None = None,
         *args,
         **kwargs,
     ):
         self.default_name = default_name
+        if clock is None:
+            # Monotonic time restarts per process, so it's only safe for
+            # buckets living and dying with this process; persistent or
+            # shared backends (SQLite, Redis) need wall-clock timestamps
+            clock = (
+                MonotonicNSClock
+                if issubclass(bucket_class, (ArrayBucket, InMemoryBucket))
+                else TimeClock
+            )
         self.clock = clock()
         self.bucket_class = bucket_class
         self.bucket_kwargs = bucket_kwargs
         if self.bucket_kwargs is None:
             self.bucket_kwargs = {}
         self.rates = rates
-        self.buckets = {
-            self.default_name: self.create(
-                self.clock, self.bucket_class, rates=self.rates, **self.bucket_kwargs
+        # Precompute the effectively-smallest rate (and its tokens/sec) once,
+        # instead of relying on list order and redoing divisions per request
+        if rates:
+            self.smallest_rate = min(rates, key=lambda r: r.limit / r.interval)
+            self.rate_per_sec_smallest = (
+                self.smallest_rate.limit / self.smallest_rate.interval * 1000
             )
-        }
+        else:
+            self.smallest_rate = None
+            self.rate_per_sec_smallest = 0.0
+        # Shard the registry (power-of-two count for a fast mask) so threaded
+        # transports hitting different hosts don't contend on a single dict
+        shard_count = 1
+        while shard_count < (cpu_count() or 4):
+            shard_count <<= 1
+        self._shard_mask = shard_count - 1
+        self._bucket_shards = tuple({} for _ in range(shard_count))
+        self._shard_for(self.default_name)[self.default_name] = self.create(
+            self.clock, self.bucket_class, rates=self.rates, **self.bucket_kwargs
+        )
         super().__init__(*args, **kwargs)
 
+    def _shard_for(self, name) -> dict:
+        """Get the registry shard holding the bucket for ``name``"""
+        return self._bucket_shards[hash(name) & self._shard_mask]
+
+    @property
+    def buckets(self) -> dict:
+        """Merged view of all registry shards, mainly for introspection"""
+        merged = {}
+        for shard in self._bucket_shards:
+            merged.update(shard)
+        return merged
+
     def wrap_item(
         self, name: str, weight: int = 1
     ) -> Union[RateItem, Awaitable[RateItem]]:
         now = self.clock.now()
         return RateItem(name, now, weight)
 
-    def get(self, item: RateItem) -> AbstractBucket:
-        name = item.name
-        if name not in self.buckets:
-            self.buckets[name] = self.create(
+    def get_by_name(self, name) -> AbstractBucket:
+        """Get (or create) the bucket for ``name`` directly, without
+        wrapping it in a throwaway ``RateItem`` first
+        """
+        # Single hashed lookup in the common (cached) case; misses are rare
+        shard = self._bucket_shards[hash(name) & self._shard_mask]
+        try:
+            return shard[name]
+        except KeyError:
+            bucket = self.create(
                 self.clock, self.bucket_class, rates=self.rates, **self.bucket_kwargs
             )
-        return self.buckets[name]
+            # Intern the name so repeat hosts share one string object,
+            # making future hash/equality checks cheaper (httpx netloc
+            # names are bytes, which can't be interned)
+            shard[intern(name) if isinstance(name, str) else name] = bucket
+            return bucket
+
+    def get(self, item: RateItem) -> AbstractBucket:
+        return self.get_by_name(item.name)
 
 
 class LimiterMixin(MIXIN_BASE):
@@ -81,49 +343,162 @@ class LimiterMixin(MIXIN_BASE):
         per_month: float = 0,
         burst: float = 1,
         rates: Rate | list[Rate] = None,
-        bucket_class: type[AbstractBucket] = InMemoryBucket,
+        bucket_class: type[AbstractBucket] = ArrayBucket,
         bucket_kwargs: dict | None = None,
         bucket_factory: type[BucketFactory] = NameBucketFactory,
         limiter: Limiter | None = None,
         raise_when_fail: bool = True,
         max_delay: Union[int, float, None] = None,
-        clock: type[AbstractClock] = TimeClock,
+        clock: type[AbstractClock] | None = None,
         per_host: bool = True,
         limit_statuses: Iterable[int] = (429,),
         **kwargs,
     ):
         if rates is None:
             rates = []
-        # Translate request rate values into Rate objects
-        per_rates = [
-            Rate(limit, interval)
-            for interval, limit in [
-                (Duration.SECOND * burst, per_second * burst),
-                (Duration.MINUTE, per_minute),
-                (Duration.HOUR, per_hour),
-                (Duration.DAY, per_day),
-                (Duration.WEEK * 4, per_month),
-            ]
-            if limit
-        ]
-        rates += per_rates
-        self.default_name = str(uuid4())
-        self.limit_statuses = limit_statuses
+        self._append_per_rates(
+            rates, per_second, per_minute, per_hour, per_day, per_month, burst
+        )
+        # A unique default name is only needed when all requests share one
+        # bucket; in per-host mode it's just the seed bucket's key, so skip
+        # the uuid4() (CSPRNG) call on construction
+        self.default_name = NameBucketFactory.DEFAULT_NAME if per_host else str(uuid4())
+        # Normalize to frozenset for O(1) membership checks per response
+        self.limit_statuses = frozenset(limit_statuses)
         self.max_delay = max_delay
         self.per_host = per_host
-        self.bucket_factory = bucket_factory(
-            rates, self.default_name, clock, bucket_class, bucket_kwargs
-        )
-        # create limiter object
-        self.limiter = limiter or Limiter(
-            self.bucket_factory, raise_when_fail=raise_when_fail, max_delay=max_delay
+        # per_host is fixed for the life of the transport, so specialize name
+        # resolution here instead of branching on it per request (skipped if
+        # a subclass overrides _name with its own logic)
+        if type(self)._name is LimiterMixin._name:
+            if per_host:
+                self._name = attrgetter("url.netloc")
+            else:
+                default_name = self.default_name
+                self._name = lambda _request: default_name
+        self._init_limiter(
+            rates,
+            bucket_factory,
+            bucket_class,
+            bucket_kwargs,
+            clock,
+            limiter,
+            raise_when_fail,
+            max_delay,
         )
+        self._init_local_state(rates)
 
         # If the superclass is an BaseTransport subclass,
         # pass along any valid keyword arguments
         session_kwargs = get_valid_kwargs(super().__init__, kwargs)
         super().__init__(**session_kwargs)  # type: ignore
 
+        # Bind the superclass handler once instead of rebuilding the super
+        # proxy (and walking the MRO) on every request; None for bare mixin
+        # usage without a transport superclass
+        self._super_handle_request = getattr(super(), "handle_request", None)
+
+        # For the overwhelmingly common configuration, swap in a compiled
+        # handle_request with the constant parts inlined (skipped if a
+        # subclass overrides handle_request or _name with its own logic,
+        # since the template inlines the per-host name lookup)
+        if (
+            self._rate_limiting_enabled
+            and per_host
+            and self.limit_statuses == frozenset((429,))
+            and type(self)._name is LimiterMixin._name
+            and type(self).handle_request is LimiterMixin.handle_request
+        ):
+            self._specialize_handle_request()
+
+    @staticmethod
+    def _append_per_rates(  # noqa: PLR0913
+        rates: list[Rate],
+        per_second: float,
+        per_minute: float,
+        per_hour: float,
+        per_day: float,
+        per_month: float,
+        burst: float,
+    ) -> None:
+        """Translate the ``per_*`` request rate values into Rate objects,
+        appending directly instead of filtering an intermediate
+        (interval, limit) tuple list
+        """
+        if per_second:
+            if burst == 1:
+                rates.append(Rate(per_second, Duration.SECOND))
+            else:
+                rates.append(Rate(per_second * burst, Duration.SECOND * burst))
+        if per_minute:
+            rates.append(Rate(per_minute, Duration.MINUTE))
+        if per_hour:
+            rates.append(Rate(per_hour, Duration.HOUR))
+        if per_day:
+            rates.append(Rate(per_day, Duration.DAY))
+        if per_month:
+            rates.append(Rate(per_month, Duration.WEEK * 4))
+
+    def _init_limiter(  # noqa: PLR0913
+        self,
+        rates: list[Rate],
+        bucket_factory: type[BucketFactory],
+        bucket_class: type[AbstractBucket],
+        bucket_kwargs: dict | None,
+        clock: type[AbstractClock] | None,
+        limiter: Limiter | None,
+        raise_when_fail: bool,
+        max_delay: Union[int, float, None],
+    ) -> None:
+        """Create the bucket factory and limiter for the given config.
+
+        With no rates and no explicit limiter there's nothing to enforce,
+        so both stay ``None`` and ``handle_request`` bypasses limiting.
+        """
+        self._rate_limiting_enabled = bool(rates) or limiter is not None
+        if rates:
+            self.bucket_factory = bucket_factory(
+                rates, self.default_name, clock, bucket_class, bucket_kwargs
+            )
+        else:
+            self.bucket_factory = None
+        if self._rate_limiting_enabled:
+            self.limiter = limiter or Limiter(
+                self.bucket_factory,
+                raise_when_fail=raise_when_fail,
+                max_delay=max_delay,
+            )
+            if self.bucket_factory is None:
+                # Rate-less config with an explicit limiter: the 429 catch-up
+                # path should fill that limiter's own buckets
+                self.bucket_factory = self.limiter.bucket_factory
+        else:
+            self.limiter = None
+
+    def _init_local_state(self, rates: list[Rate]) -> None:
+        """Set up the local token cache, fill dedupe state and per-name locks"""
+        # Local token pre-borrow cache, mapping name -> _LocalBucket.
+        # Requests served from it were already accounted for by a weighted
+        # limiter acquisition, so they can skip the (locking) limiter
+        self._local_tokens: dict[str, _LocalBucket] = {}
+        smallest = getattr(self.bucket_factory, "smallest_rate", None)
+        if smallest is None and rates:
+            # Custom factories may not precompute this; do it ourselves
+            smallest = min(rates, key=lambda r: r.limit / r.interval)
+        if smallest is not None:
+            self._token_limit = smallest.limit
+            self._fill_interval = smallest.interval / 1000
+        else:
+            self._token_limit = 0
+            self._fill_interval = 0.0
+        # Timestamps of the last bucket fill per name, to dedupe bursts of
+        # 429s within one rate window
+        self._last_fill: dict[str, float] = {}
+        # Per-name locks so concurrent 429 handling for different hosts
+        # doesn't serialize globally; the guard only protects registry inserts
+        self._bucket_locks: dict[str, Lock] = {}
+        self._bucket_locks_guard = Lock()
+
     def handle_request(self, request: Request, **kwargs) -> Response:
         """Send a request with rate-limiting.
 
@@ -131,18 +506,105 @@ class LimiterMixin(MIXIN_BASE):
             :py:exc:`.BucketFullException` if raise_when_fail is ``True`` and this
                 request would result in a delay longer than ``max_delay``
         """
-        self.limiter.try_acquire(self._name(request))
-        response = super().handle_request(request, **kwargs)
+        if not self._rate_limiting_enabled:
+            return self._super_handle_request(request, **kwargs)
+        name = self._name(request)
+        if not self._try_consume_local(name):
+            self._acquire(name)
+        response = self._super_handle_request(request, **kwargs)
         if response.status_code in self.limit_statuses:
-            self._fill_bucket(request)
+            # Drop local tokens so catch-up goes through the real limiter
+            self._drain_local(name)
+            self._fill_bucket(name)
         return response
 
+    def _specialize_handle_request(self) -> None:
+        """Compile a specialized ``handle_request`` for this instance.
+
+        With ``per_host=True`` and the default ``limit_statuses``, the name
+        lookup, status check and superclass dispatch are all constant, so
+        they can be inlined into a generated closure with no per-request
+        attribute lookups or branches on configuration.
+        """
+        if self._super_handle_request is None:
+            # Bare mixin usage without a transport superclass
+            return
+        namespace = {
+            "try_consume_local": self._try_consume_local,
+            "try_acquire": self._acquire,
+            "super_handle": self._super_handle_request,
+            "drain_local": self._drain_local,
+            "fill_bucket": self._fill_bucket,
+        }
+        exec(_FAST_HANDLE_TEMPLATE, namespace)  # noqa: S102
+        self.handle_request = namespace["_fast_handle"].__get__(self)
+
+    def _try_consume_local(self, name: str) -> bool:
+        """Consume one pre-borrowed token from the local cache for ``name``.
+
+        Returns ``True`` if a banked token was available, meaning the real
+        limiter already accounted for this request as part of an earlier
+        weighted acquisition and can be skipped. With nothing banked, the
+        request goes through the real limiter.
+        """
+        if not self._token_limit:
+            return False
+        try:
+            local = self._local_tokens[name]
+        except KeyError:
+            local = self._local_tokens.setdefault(
+                name, _LocalBucket(self._token_limit, self._fill_interval)
+            )
+        return local.try_consume(monotonic())
+
+    def _acquire(self, name: str) -> None:
+        """Slow path: acquire from the real limiter, borrowing a batch of
+        tokens sized to the observed QPS so high-throughput names amortize
+        the limiter's lock and clock across many requests.
+
+        Batching is skipped when ``max_delay`` is configured: a weighted
+        acquisition would make the limiter sleep until the whole batch
+        fits, turning one unlucky request into a multi-token wait where a
+        single-token acquire would return almost immediately.
+        """
+        local = self._local_tokens.get(name)
+        if local is not None and self.max_delay is None:
+            borrow = local.suggest_borrow()
+            if borrow > 1:
+                # A failed batch shouldn't fail the request; retry singly
+                with suppress(BucketFullException):
+                    if self.limiter.try_acquire(name, weight=borrow):
+                        # One token covers this request; bank the rest locally
+                        now = monotonic()
+                        local.credit(borrow - 1, now)
+                        local.record_admit(now)
+                        return
+        self.limiter.try_acquire(name)
+        if local is not None:
+            # Raises above mean the request is never sent; getting here
+            # means it will be (even a silent limiter failure sends it)
+            local.record_admit(monotonic())
+
+    def _drain_local(self, name: str) -> None:
+        """Drop the local tokens for ``name``, if any"""
+        local = self._local_tokens.get(name)
+        if local is not None:
+            local.drain()
+
     def _name(self, request: Request):
         """Get a name for the given request"""
         return request.url.netloc if self.per_host else self.default_name
 
-    def _fill_bucket(self, request: Request):
-        """Partially fill the bucket for the given request, requiring an extra delay
+    def _get_bucket_lock(self, name) -> Lock:
+        """Get (or lazily create) the lock guarding the bucket for ``name``"""
+        try:
+            return self._bucket_locks[name]
+        except KeyError:
+            with self._bucket_locks_guard:
+                return self._bucket_locks.setdefault(name, Lock())
+
+    def _fill_bucket(self, name: str):
+        """Partially fill the bucket for the given name, requiring an extra delay
         until the next request. This is essentially an attempt to catch up to the actual
         (server-side) limit if we've gotten out of sync.
 
@@ -156,17 +618,95 @@ class LimiterMixin(MIXIN_BASE):
         If the server also has an hourly limit, we don't have enough information to know
         if we've exceeded that limit or how long to delay, so we'll keep delaying in
         1-minute intervals.
+
+        A burst of concurrent 429s would otherwise fill the bucket once per
+        response and massively over-delay, so fills are deduped: at most one
+        per name per smallest-rate interval.
         """
-        logger.info(f"Rate limit exceeded for {request.url}; filling limiter bucket")
-        item = self.bucket_factory.wrap_item(self._name(request))
-        bucket = self.bucket_factory.get(item)
+        # Look the bucket up by name directly; custom factories without
+        # get_by_name go through the RateItem-based interface
+        get_by_name = getattr(self.bucket_factory, "get_by_name", None)
+        if get_by_name is not None:
+            bucket = get_by_name(name)
+        else:
+            bucket = self.bucket_factory.get(self.bucket_factory.wrap_item(name))
+
+        # The dedupe check and the count/put pair below must not interleave
+        # with another filler, so take the per-name lock (not a global one)
+        # around them; checking outside the lock would let a concurrent 429
+        # burst race past the dedupe and double-fill
+        with self._get_bucket_lock(name):
+            now = monotonic()
+            last = self._last_fill.get(name)
+            if last is not None and now - last < self._fill_interval:
+                return
+
+            logger.info(f"Rate limit exceeded for {name}; filling limiter bucket")
+            # Determine how many filler requests we should add to reach the
+            # limit, sized from the bucket's actual in-window occupancy (leak
+            # expired items first so count() matches the sliding window the
+            # bucket enforces; anything coarser can oversize the fill and
+            # make put() refuse it outright)
+            rate = (
+                getattr(self.bucket_factory, "smallest_rate", None) or bucket.rates[0]
+            )
+            clock = getattr(self.bucket_factory, "clock", None)
+            if clock is not None:
+                bucket.leak(clock.now())
+            item_count = rate.limit - bucket.count()
+            if item_count <= 0:
+                return
 
-        # Determine how many filler request we should add to reach a limit
-        rate = bucket.rates[0]
-        item_count = rate.limit - bucket.count()
+            # Add "filler" requests to reach the limit for that interval;
+            # only a fill that actually lands starts a new dedupe window, so
+            # a skipped or refused fill can't suppress later 429s
+            if bucket.put(self.bucket_factory.wrap_item(name, item_count)):
+                self._last_fill[name] = now
 
-        # Add "filler" requests to reach the limit for that interval
-        bucket.put(self.bucket_factory.wrap_item(self._name(request), item_count))
+
+class AsyncLimiterMixin(LimiterMixin):
+    """Mixin class that adds rate-limiting behavior to async httpx transports.
+
+    The limiter itself is blocking (it sleeps while waiting for capacity),
+    so acquisition runs in a worker thread instead of stalling the event
+    loop; per-name asyncio locks keep awaiters for different hosts from
+    serializing each other while bounding thread fan-out per bucket.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._async_bucket_locks: dict[str, asyncio.Lock] = {}
+        self._super_handle_async_request = getattr(
+            super(), "handle_async_request", None
+        )
+
+    async def handle_async_request(self, request: Request, **kwargs) -> Response:
+        """Send a request with rate-limiting.
+
+        Raises:
+            :py:exc:`.BucketFullException` if raise_when_fail is ``True`` and this
+                request would result in a delay longer than ``max_delay``
+        """
+        if not self._rate_limiting_enabled:
+            return await self._super_handle_async_request(request, **kwargs)
+        name = self._name(request)
+        if not self._try_consume_local(name):
+            await self._acquire_async(name)
+        response = await self._super_handle_async_request(request, **kwargs)
+        if response.status_code in self.limit_statuses:
+            # Drop local tokens so catch-up goes through the real limiter
+            self._drain_local(name)
+            self._fill_bucket(name)
+        return response
+
+    async def _acquire_async(self, name) -> None:
+        """Acquire from the limiter without blocking the event loop"""
+        try:
+            lock = self._async_bucket_locks[name]
+        except KeyError:
+            lock = self._async_bucket_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            await asyncio.to_thread(self._acquire, name)
 
 
 class LimiterTransport(LimiterMixin, HTTPTransport):
@@ -189,9 +729,10 @@ class LimiterTransport(LimiterMixin, HTTPTransport):
         burst: Max number of consecutive requests allowed before applying per-second
             rate-limiting
         bucket_class: Bucket backend class; may be one of
-            :py:class:`~pyrate_limiter.bucket.MemoryQueueBucket` (default),
-            :py:class:`~pyrate_limiter.sqlite_bucket.SQLiteBucket`, or
-            :py:class:`~pyrate_limiter.bucket.RedisBucket`
+            :py:class:`.ArrayBucket` (default),
+            :py:class:`~pyrate_limiter.buckets.InMemoryBucket`,
+            :py:class:`~pyrate_limiter.buckets.SQLiteBucket`, or
+            :py:class:`~pyrate_limiter.buckets.RedisBucket`
         bucket_kwargs: Bucket backend keyword arguments
         bucket_factory: Bucket Factory class
         raise_when_fail: Raise an exception. Read max_delay documentation for more
@@ -206,7 +747,27 @@ class LimiterTransport(LimiterMixin, HTTPTransport):
     """
 
 
+class AsyncLimiterTransport(AsyncLimiterMixin, AsyncHTTPTransport):
+    """`Transport <https://www.python-httpx.org/advanced/#custom-transports>`_
+    that adds rate-limiting behavior to ``httpx.AsyncClient``.
+
+    Takes the same parameters as :py:class:`.LimiterTransport`.
+    """
+
+
+@cache
+def _func_params(func: Callable) -> frozenset:
+    """Get the parameter names accepted by ``func``, memoized per function.
+
+    ``inspect.signature`` is expensive, and the answer never changes for a
+    given function, so cache it instead of re-parsing on every call.
+    """
+    return frozenset(signature(func).parameters)
+
+
 def get_valid_kwargs(func: Callable, kwargs: dict) -> dict:
     """Get the subset of non-None ``kwargs`` that are valid params for ``func``"""
-    sig_params = list(signature(func).parameters)
+    # Cache on the underlying function for bound methods, so the cache is
+    # shared across instances (and doesn't keep them alive)
+    sig_params = _func_params(getattr(func, "__func__", func))
     return {k: v for k, v in kwargs.items() if k in sig_params and v is not None}